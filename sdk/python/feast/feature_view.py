@@ -111,14 +111,16 @@ class FeatureView(BaseFeatureView):
 
         _features = features or []
 
-        cols = [entity for entity in entities] + [feat.name for feat in _features]
-        for col in cols:
-            if _input.field_mapping is not None and col in _input.field_mapping.keys():
-                raise ValueError(
-                    f"The field {col} is mapped to {_input.field_mapping[col]} for this data source. "
-                    f"Please either remove this field mapping or use {_input.field_mapping[col]} as the "
-                    f"Entity or Feature name."
-                )
+        field_mapping = _input.field_mapping
+        if field_mapping:
+            cols = [entity for entity in entities] + [feat.name for feat in _features]
+            for col in cols:
+                if col in field_mapping:
+                    raise ValueError(
+                        f"The field {col} is mapped to {field_mapping[col]} for this data source. "
+                        f"Please either remove this field mapping or use {field_mapping[col]} as the "
+                        f"Entity or Feature name."
+                    )
 
         super().__init__(name, _features)
         self.entities = entities if entities else [DUMMY_ENTITY_NAME]
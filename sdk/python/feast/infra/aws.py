@@ -4,8 +4,8 @@ import logging
 import os
 import uuid
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
-from tempfile import TemporaryFile
 from typing import Optional, Sequence
 from urllib.parse import urlparse
 
@@ -362,7 +362,7 @@ class S3RegistryStore(RegistryStore):
 
     @log_exceptions_and_usage(registry="s3")
     def get_registry_proto(self):
-        file_obj = TemporaryFile()
+        file_obj = BytesIO()
         registry_proto = RegistryProto()
         try:
             from botocore.exceptions import ClientError
@@ -385,14 +385,29 @@ class S3RegistryStore(RegistryStore):
         try:
             obj = bucket.Object(self._key)
             obj.download_fileobj(file_obj)
-            file_obj.seek(0)
-            registry_proto.ParseFromString(file_obj.read())
+            registry_proto.ParseFromString(file_obj.getvalue())
             return registry_proto
         except ClientError as e:
             raise FileNotFoundError(
                 f"Error while trying to locate Registry at path {self._uri.geturl()}"
             ) from e
 
+    @log_exceptions_and_usage(registry="s3")
+    def get_registry_proto_version(self) -> Optional[str]:
+        try:
+            from botocore.exceptions import ClientError
+        except ImportError as e:
+            from feast.errors import FeastExtrasDependencyImportError
+
+            raise FeastExtrasDependencyImportError("aws", str(e))
+        try:
+            response = self.s3_client.meta.client.head_object(
+                Bucket=self._bucket, Key=self._key
+            )
+        except ClientError:
+            return None
+        return response.get("ETag")
+
     @log_exceptions_and_usage(registry="s3")
     def update_registry_proto(self, registry_proto: RegistryProto):
         self._write_registry(registry_proto)
@@ -404,7 +419,5 @@ class S3RegistryStore(RegistryStore):
         registry_proto.version_id = str(uuid.uuid4())
         registry_proto.last_updated.FromDatetime(datetime.utcnow())
         # we have already checked the bucket exists so no need to do it again
-        file_obj = TemporaryFile()
-        file_obj.write(registry_proto.SerializeToString())
-        file_obj.seek(0)
+        file_obj = BytesIO(registry_proto.SerializeToString())
         self.s3_client.Bucket(self._bucket).put_object(Body=file_obj, Key=self._key)
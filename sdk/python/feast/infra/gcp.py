@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
-from tempfile import TemporaryFile
+from typing import Optional
 from urllib.parse import urlparse
 
 from feast.infra.passthrough_provider import PassthroughProvider
@@ -39,7 +40,7 @@ class GCSRegistryStore(RegistryStore):
         import google.cloud.storage as storage
         from google.cloud.exceptions import NotFound
 
-        file_obj = TemporaryFile()
+        file_obj = BytesIO()
         registry_proto = RegistryProto()
         try:
             bucket = self.gcs_client.get_bucket(self._bucket)
@@ -51,13 +52,25 @@ class GCSRegistryStore(RegistryStore):
             self.gcs_client.download_blob_to_file(
                 self._uri.geturl(), file_obj, timeout=30
             )
-            file_obj.seek(0)
-            registry_proto.ParseFromString(file_obj.read())
+            registry_proto.ParseFromString(file_obj.getvalue())
             return registry_proto
         raise FileNotFoundError(
             f'Registry not found at path "{self._uri.geturl()}". Have you run "feast apply"?'
         )
 
+    @log_exceptions_and_usage(registry="gs")
+    def get_registry_proto_version(self) -> Optional[str]:
+        from google.cloud.exceptions import NotFound
+
+        try:
+            blob = self.gcs_client.bucket(self._bucket).get_blob(self._blob)
+        except NotFound:
+            return None
+        if blob is None or blob.generation is None:
+            return None
+        # The generation of a blob changes every time it is overwritten
+        return str(blob.generation)
+
     @log_exceptions_and_usage(registry="gs")
     def update_registry_proto(self, registry_proto: RegistryProto):
         self._write_registry(registry_proto)
@@ -78,7 +91,5 @@ class GCSRegistryStore(RegistryStore):
         # we have already checked the bucket exists so no need to do it again
         gs_bucket = self.gcs_client.get_bucket(self._bucket)
         blob = gs_bucket.blob(self._blob)
-        file_obj = TemporaryFile()
-        file_obj.write(registry_proto.SerializeToString())
-        file_obj.seek(0)
+        file_obj = BytesIO(registry_proto.SerializeToString())
         blob.upload_from_file(file_obj)
@@ -1,6 +1,8 @@
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from feast.feature_view import FeatureView
 from feast.infra.passthrough_provider import PassthroughProvider
@@ -18,6 +20,10 @@ class LocalProvider(PassthroughProvider):
     pass
 
 
+# Upper bound on the resolution of file modification times across filesystems
+_MTIME_GRANULARITY_NS = 2_000_000_000
+
+
 def _table_id(project: str, table: FeatureView) -> str:
     return f"{project}_{table.name}"
 
@@ -40,6 +46,18 @@ class LocalRegistryStore(RegistryStore):
             f'Registry not found at path "{self._filepath}". Have you run "feast apply"?'
         )
 
+    @log_exceptions_and_usage(registry="local")
+    def get_registry_proto_version(self) -> Optional[str]:
+        try:
+            stat = self._filepath.stat()
+        except FileNotFoundError:
+            return None
+        # Modification times can be coarser than the interval between two writes, so
+        # a file modified too recently may still be overwritten with the same mtime
+        if time.time_ns() - stat.st_mtime_ns < _MTIME_GRANULARITY_NS:
+            return None
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
     @log_exceptions_and_usage(registry="local")
     def update_registry_proto(self, registry_proto: RegistryProto):
         self._write_registry(registry_proto)
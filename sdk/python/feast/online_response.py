@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 from collections import defaultdict
-from typing import Any, Dict, List, cast
+from operator import attrgetter, methodcaller
+from typing import Any, Dict, List, Optional, Tuple, cast
 
+import numpy as np
 import pandas as pd
+import pyarrow
 
 from feast.feature_view import DUMMY_ENTITY_ID
 from feast.protos.feast.serving.ServingService_pb2 import (
@@ -24,12 +28,28 @@ from feast.protos.feast.serving.ServingService_pb2 import (
 )
 from feast.protos.feast.types.Value_pb2 import Value as Value
 from feast.type_map import (
+    _non_empty_value,
     _proto_value_to_value_type,
     _python_value_to_proto_value,
     python_values_to_feast_value_type,
 )
 from feast.value_type import ValueType
 
+# Returns the name of the field set in a Value proto, or None if it is null
+_which_val = methodcaller("WhichOneof", "val")
+
+# Numpy dtypes used for scalar Value fields when building typed columns. These
+# match the dtypes pandas infers for the equivalent Python values; fields not
+# listed here (e.g. strings, bytes and lists) are kept as object columns.
+_VAL_TYPE_TO_NUMPY_DTYPE: Dict[Optional[str], Any] = {
+    "int32_val": np.int64,
+    "int64_val": np.int64,
+    "unix_timestamp_val": np.int64,
+    "double_val": np.float64,
+    "float_val": np.float64,
+    "bool_val": np.bool_,
+}
+
 
 class OnlineResponse:
     """
@@ -43,13 +63,38 @@ class OnlineResponse:
         Args:
         online_response_proto: GetOnlineResponse proto object to construct from.
         """
+        self._columns: Dict[
+            bool, Tuple[Dict[str, Any], Dict[str, Optional[str]]]
+        ] = dict()
         self.proto = online_response_proto
-        # Delete DUMMY_ENTITY_ID from proto if it exists
-        for item in self.proto.field_values:
-            if DUMMY_ENTITY_ID in item.statuses:
-                del item.statuses[DUMMY_ENTITY_ID]
-            if DUMMY_ENTITY_ID in item.fields:
-                del item.fields[DUMMY_ENTITY_ID]
+        # Delete DUMMY_ENTITY_ID from proto if it exists. The dummy entity is
+        # set on either all records or none, so only the first one is checked.
+        field_values = self.proto.field_values
+        if field_values and (
+            DUMMY_ENTITY_ID in field_values[0].statuses
+            or DUMMY_ENTITY_ID in field_values[0].fields
+        ):
+            for item in field_values:
+                if DUMMY_ENTITY_ID in item.statuses:
+                    del item.statuses[DUMMY_ENTITY_ID]
+                if DUMMY_ENTITY_ID in item.fields:
+                    del item.fields[DUMMY_ENTITY_ID]
+
+    @property
+    def proto(self) -> GetOnlineFeaturesResponse:
+        """
+        Getter for the GetOnlineFeaturesResponse proto.
+        """
+        return self._proto
+
+    @proto.setter
+    def proto(self, online_response_proto: GetOnlineFeaturesResponse):
+        """
+        Setter for the GetOnlineFeaturesResponse proto. Drops any columns
+        extracted from the previous proto.
+        """
+        self._proto = online_response_proto
+        self._columns.clear()
 
     @property
     def field_values(self):
@@ -62,43 +107,155 @@ class OnlineResponse:
         """
         Converts GetOnlineFeaturesResponse features into a dictionary form.
         """
-        # Status for every Feature should be present in every record.
-        features_dict: Dict[str, List[Any]] = {
-            k: list() for k in self.field_values[0].statuses.keys()
+        features_dict, val_types = self._to_columns()
+        # Columns are cached, so callers get their own copies of the lists
+        return {
+            feature: list(_copy_list_values(values, val_types[feature]))
+            for feature, values in features_dict.items()
         }
+
+    def _to_columns(
+        self, numeric_as_arrays: bool = False
+    ) -> Tuple[Dict[str, Any], Dict[str, Optional[str]]]:
+        """
+        Extracts one column of values per Feature, along with the name of the
+        Value field set for each Feature (None if every value is null). The
+        result is cached, so the proto is only decoded once per representation.
+
+        Args:
+            numeric_as_arrays: If True, numeric and boolean columns are written
+                directly into typed numpy arrays instead of Python lists.
+        """
+        if numeric_as_arrays in self._columns:
+            return self._columns[numeric_as_arrays]
+
+        # Status for every Feature should be present in every record.
+        features = list(self.field_values[0].statuses.keys())
+        # The fields map of each record is fetched once and shared by every column
         rows = [record.fields for record in self.field_values]
 
+        val_types: Dict[str, Optional[str]]
+        features_dict: Dict[str, Any]
+        if len(rows) == 1 and not numeric_as_arrays:
+            # A single record (e.g. a lookup of one entity) determines the
+            # ValueType of each Feature directly, and each of its values is
+            # read as soon as its type is known.
+            row = rows[0]
+            val_types = {}
+            features_dict = {}
+            for feature in features:
+                if feature in row:
+                    value = row[feature]
+                    val_type = _which_val(value)
+                else:
+                    val_type = None
+                val_types[feature] = val_type
+                if val_type is None:
+                    features_dict[feature] = [None]
+                elif "_list_" in val_type:
+                    features_dict[feature] = [getattr(value, val_type).val[:]]
+                else:
+                    features_dict[feature] = [getattr(value, val_type)]
+            self._columns[numeric_as_arrays] = (features_dict, val_types)
+            return features_dict, val_types
+
         # Find the first non-null instance of each Feature to determine
-        # which ValueType.
-        val_types = {k: None for k in features_dict.keys()}
-        for feature in features_dict.keys():
-            for row in rows:
-                try:
-                    val_types[feature] = row[feature].WhichOneof("val")
-                except KeyError:
+        # which ValueType. The first record usually resolves every Feature;
+        # the following rows are scanned once, stopping as soon as every
+        # Feature has been resolved.
+        first_row = rows[0]
+        val_types = {
+            feature: _which_val(first_row[feature]) if feature in first_row else None
+            for feature in features
+        }
+        unresolved = {feature for feature, vt in val_types.items() if vt is None}
+        for row in itertools.islice(rows, 1, None):
+            if not unresolved:
+                break
+            for feature in list(unresolved):
+                if feature not in row:
                     continue
-                if val_types[feature] is not None:
-                    break
+                val_type = _which_val(row[feature])
+                if val_type is not None:
+                    val_types[feature] = val_type
+                    unresolved.discard(feature)
 
         # Now we know what attribute to fetch.
-        for feature, val_type in val_types.items():
-            if val_type is None:
-                features_dict[feature] = [None] * len(rows)
-            else:
-                for row in rows:
-                    val = getattr(row[feature], val_type)
-                    if "_list_" in val_type:
-                        val = list(val.val)
-                    features_dict[feature].append(val)
+        features_dict = {
+            feature: _extract_column(
+                rows, feature, val_types[feature], numeric_as_arrays
+            )
+            for feature in features
+        }
 
-        return features_dict
+        self._columns[numeric_as_arrays] = (features_dict, val_types)
+        return features_dict, val_types
 
     def to_df(self) -> pd.DataFrame:
         """
         Converts GetOnlineFeaturesResponse features into Panda dataframe form.
         """
+        # Hand numeric columns to pandas as typed arrays so that it does not
+        # have to infer them from lists of Python objects. The columns are
+        # cached, so the DataFrame gets its own copy of them.
+        features_dict, val_types = self._to_columns(numeric_as_arrays=True)
+
+        return pd.DataFrame(
+            {
+                feature: _copy_list_values(values, val_types[feature])
+                for feature, values in features_dict.items()
+            },
+            copy=True,
+        )
+
+    def to_arrow(self) -> pyarrow.Table:
+        """
+        Converts GetOnlineFeaturesResponse features into a pyarrow Table.
+        """
+        # Numeric columns are built as typed numpy arrays, which Arrow wraps
+        # without converting each value.
+        features_dict, _ = self._to_columns(numeric_as_arrays=True)
+
+        return pyarrow.table(
+            {
+                feature: pyarrow.array(values)
+                for feature, values in features_dict.items()
+            }
+        )
+
+
+def _extract_column(
+    rows: List[Any], feature: str, val_type: Optional[str], numeric_as_arrays: bool,
+) -> Any:
+    """
+    Extracts the values of a single Feature from the fields map of every record.
+    Every value of a Feature shares the same ValueType, so the column is built
+    in one pass.
+    """
+    if val_type is None:
+        return [None] * len(rows)
+
+    if "_list_" in val_type:
+        # Slicing a repeated field copies it into a list faster than list()
+        return [getattr(row[feature], val_type).val[:] for row in rows]
 
-        return pd.DataFrame(self.to_dict())
+    dtype = _VAL_TYPE_TO_NUMPY_DTYPE.get(val_type) if numeric_as_arrays else None
+    if dtype is None:
+        return [getattr(row[feature], val_type) for row in rows]
+    getter = attrgetter(val_type)
+    return np.fromiter(
+        (getter(row[feature]) for row in rows), dtype=dtype, count=len(rows),
+    )
+
+
+def _copy_list_values(values: Any, val_type: Optional[str]) -> Any:
+    """
+    Copies each value of a column of list Features, since the lists would
+    otherwise be shared with the cached column. Other columns are returned as is.
+    """
+    if val_type is not None and "_list_" in val_type:
+        return [value[:] for value in values]
+    return values
 
 
 def _infer_online_entity_rows(
@@ -116,24 +273,57 @@ def _infer_online_entity_rows(
     entity_rows_dicts = cast(List[Dict[str, Any]], entity_rows)
     entity_row_list = []
     entity_type_map: Dict[str, ValueType] = dict()
-    entity_python_values_map = defaultdict(list)
+    entity_python_values_map: Dict[str, List[Any]] = dict()
+    # Python type shared by all values of an entity, or None if they differ
+    entity_python_types: Dict[str, Optional[type]] = dict()
 
-    # Flatten keys-value dicts into lists for type inference
-    for entity in entity_rows_dicts:
-        for key, value in entity.items():
-            if isinstance(value, Value):
-                inferred_type = _proto_value_to_value_type(value)
-                # If any ProtoValues were present their types must all be the same
-                if key in entity_type_map and entity_type_map.get(key) != inferred_type:
-                    raise TypeError(
-                        f"Input entity {key} has mixed types, {entity_type_map.get(key)} and {inferred_type}. That is not allowed."
-                    )
-                entity_type_map[key] = inferred_type
-            else:
-                entity_python_values_map[key].append(value)
+    # Transpose the rows into one column of values per entity. Rows normally
+    # all have the same keys, in which case each column is built in one pass.
+    entity_columns: Dict[str, List[Any]]
+    if entity_rows_dicts and all(
+        entity.keys() == entity_rows_dicts[0].keys() for entity in entity_rows_dicts
+    ):
+        entity_columns = {
+            key: [entity[key] for entity in entity_rows_dicts]
+            for key in entity_rows_dicts[0]
+        }
+    else:
+        entity_columns = defaultdict(list)
+        for entity in entity_rows_dicts:
+            for key, value in entity.items():
+                entity_columns[key].append(value)
+
+    # Split each column into ProtoValues and Python values for type inference
+    for key, values in entity_columns.items():
+        proto_values = [value for value in values if isinstance(value, Value)]
+        for value in proto_values:
+            inferred_type = _proto_value_to_value_type(value)
+            # If any ProtoValues were present their types must all be the same
+            if key in entity_type_map and entity_type_map.get(key) != inferred_type:
+                raise TypeError(
+                    f"Input entity {key} has mixed types, {entity_type_map.get(key)} and {inferred_type}. That is not allowed."
+                )
+            entity_type_map[key] = inferred_type
+
+        python_values = (
+            [value for value in values if not isinstance(value, Value)]
+            if proto_values
+            else values
+        )
+        if python_values:
+            entity_python_values_map[key] = python_values
+            python_types = {type(value) for value in python_values}
+            entity_python_types[key] = (
+                python_types.pop() if len(python_types) == 1 else None
+            )
 
     # Loop over all entities to infer dtype first in case of empty lists or nulls
     for key, values in entity_python_values_map.items():
+        # Scalars of a single Python type all map to the same ValueType, so
+        # only lists and mixed inputs need every value to be inspected.
+        python_type = entity_python_types[key]
+        if python_type is not None and python_type not in (list, np.ndarray):
+            values = values[:1]
         inferred_type = python_values_to_feast_value_type(key, values)
 
         # If any ProtoValues were present their types must match the inferred type
@@ -144,8 +334,17 @@ def _infer_online_entity_rows(
 
         entity_type_map[key] = inferred_type
 
+    # Convert the Python values of each entity in a single batch. Rows are
+    # visited in the same order below, so the converted values can be consumed
+    # sequentially.
+    entity_proto_values_map = {
+        key: iter(_python_value_to_proto_value(entity_type_map[key], values))
+        for key, values in entity_python_values_map.items()
+    }
+
     for entity in entity_rows_dicts:
-        fields = {}
+        entity_row = GetOnlineFeaturesRequestV2.EntityRow()
+        fields = entity_row.fields
         for key, value in entity.items():
             if key not in entity_type_map:
                 raise ValueError(
@@ -155,9 +354,10 @@ def _infer_online_entity_rows(
             if isinstance(value, Value):
                 proto_value = value
             else:
-                proto_value = _python_value_to_proto_value(
-                    entity_type_map[key], [value]
-                )[0]
-            fields[key] = proto_value
-        entity_row_list.append(GetOnlineFeaturesRequestV2.EntityRow(fields=fields))
+                proto_value = next(entity_proto_values_map[key])
+                # Empty values are left unset, as when converted on their own
+                if not _non_empty_value(value):
+                    proto_value = Value()
+            fields[key].CopyFrom(proto_value)
+        entity_row_list.append(entity_row)
     return entity_row_list
@@ -12,16 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
+import time
+import weakref
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from threading import Lock
-from typing import Any, Dict, List, Optional
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from google.protobuf.internal.containers import RepeatedCompositeFieldContainer
-from google.protobuf.json_format import MessageToDict
-from proto import Message
 
 from feast import importer
 from feast.base_feature_view import BaseFeatureView
@@ -44,7 +46,21 @@ from feast.feature_service import FeatureService
 from feast.feature_view import FeatureView
 from feast.infra.infra_object import Infra
 from feast.on_demand_feature_view import OnDemandFeatureView
+from feast.protos.feast.core.FeatureView_pb2 import FeatureView as FeatureViewProto
+from feast.protos.feast.core.OnDemandFeatureView_pb2 import (
+    OnDemandFeatureView as OnDemandFeatureViewProto,
+)
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
+from feast.protos.feast.core.RequestFeatureView_pb2 import (
+    RequestFeatureView as RequestFeatureViewProto,
+)
+from feast.registry_dict_utils import (
+    entity_proto_to_dict,
+    feature_service_proto_to_dict,
+    feature_view_proto_to_dict,
+    on_demand_feature_view_proto_to_dict,
+    request_feature_view_proto_to_dict,
+)
 from feast.registry_store import NoopRegistryStore
 from feast.repo_config import RegistryConfig
 from feast.request_feature_view import RequestFeatureView
@@ -65,9 +81,172 @@ REGISTRY_STORE_CLASS_FOR_SCHEME = {
     "": "LocalRegistryStore",
 }
 
+# Repeated fields of the RegistryProto compared by diff_between, along with the
+# names of the objects they contain
+REGISTRY_OBJECT_TYPE_TO_STR = {
+    "entities": "entity",
+    "feature_views": "feature view",
+    "feature_tables": "feature table",
+    "on_demand_feature_views": "on demand feature view",
+    "request_feature_views": "request feature view",
+    "feature_services": "feature service",
+}
+
+# Repeated fields of the RegistryProto that each type of feature view is stored in
+FEATURE_VIEW_CLASS_TO_FIELD = {
+    FeatureView: "feature_views",
+    OnDemandFeatureView: "on_demand_feature_views",
+    RequestFeatureView: "request_feature_views",
+}
+
+# Feature view names are unique across these fields, along with the protos they
+# contain; when a name is stored in several of them, the first one is checked
+# for conflicts
+FEATURE_VIEW_FIELDS_BY_PRECEDENCE = (
+    ("request_feature_views", RequestFeatureViewProto),
+    ("feature_views", FeatureViewProto),
+    ("on_demand_feature_views", OnDemandFeatureViewProto),
+)
+
+# Fraction of the cache ttl after which the cache is refreshed in the background,
+# when proactive refreshes are enabled
+PROACTIVE_REFRESH_TTL_FRACTION = 0.8
+
 logger = logging.getLogger(__name__)
 
 
+class _RegistryIndex:
+    """
+    Positions of the objects stored in the repeated fields of a RegistryProto,
+    keyed by project and then by name. The number of projects each name is
+    indexed in is also kept, to look names up across projects. Each field is
+    indexed the first time it is looked up; the repeated fields must only be
+    modified through the index afterwards.
+    """
+
+    def __init__(self, registry_proto: RegistryProto):
+        self.registry_proto = registry_proto
+        self._positions: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self._name_counts: Dict[str, Dict[str, int]] = {}
+
+    def _field_positions(self, field: str) -> Dict[str, Dict[str, int]]:
+        positions = self._positions.get(field)
+        if positions is None:
+            positions = {}
+            name_counts: Dict[str, int] = {}
+            for idx, proto in enumerate(getattr(self.registry_proto, field)):
+                _add_position(positions, name_counts, proto, idx)
+            # Readers use the index without a lock, so the maps of a field are
+            # only published once complete. The positions mark the field as
+            # indexed, so they are published last.
+            self._name_counts[field] = name_counts
+            self._positions[field] = positions
+        return positions
+
+    def _remove_position(self, field: str, proto: Any):
+        del self._positions[field][proto.spec.project][proto.spec.name]
+        name_counts = self._name_counts[field]
+        name = proto.spec.name
+        if name_counts[name] == 1:
+            del name_counts[name]
+        else:
+            name_counts[name] -= 1
+
+    def positions(self, field: str, project: str) -> Dict[str, int]:
+        return self._field_positions(field).get(project, {})
+
+    def has_name(self, field: str, name: str) -> bool:
+        """Returns whether an object with the given name exists in any project."""
+        self._field_positions(field)
+        return name in self._name_counts[field]
+
+    def append(self, field: str, proto: Any):
+        container = getattr(self.registry_proto, field)
+        container.append(proto)
+        _add_position(
+            self._field_positions(field),
+            self._name_counts[field],
+            proto,
+            len(container) - 1,
+        )
+
+    def replace(self, field: str, idx: int, proto: Any):
+        # The stored proto is removed rather than overwritten, since callers may
+        # still hold references to it (e.g. in a RegistryDiff). The new proto
+        # takes its position, so the index does not change.
+        container = getattr(self.registry_proto, field)
+        del container[idx]
+        container.insert(idx, proto)
+
+    def delete(self, field: str, idx: int):
+        # The last object is moved into the deleted position, so that the
+        # positions of the other objects do not change. It is popped and
+        # inserted rather than copied over the deleted proto, which callers may
+        # still hold references to.
+        container = getattr(self.registry_proto, field)
+        positions = self._field_positions(field)
+        self._remove_position(field, container[idx])
+        last_idx = len(container) - 1
+        if idx == last_idx:
+            del container[idx]
+            return
+
+        last_proto = container.pop()
+        del container[idx]
+        container.insert(idx, last_proto)
+        project_positions = positions[last_proto.spec.project]
+        if project_positions.get(last_proto.spec.name) == last_idx:
+            project_positions[last_proto.spec.name] = idx
+
+
+def _add_position(
+    positions: Dict[str, Dict[str, int]],
+    name_counts: Dict[str, int],
+    proto: Any,
+    idx: int,
+):
+    """Indexes the position of an object, unless its name is already indexed in its project."""
+    project_positions = positions.setdefault(proto.spec.project, {})
+    name = proto.spec.name
+    if name not in project_positions:
+        project_positions[name] = idx
+        name_counts[name] = name_counts.get(name, 0) + 1
+
+
+def _is_object(proto: Any, name: str, project: str) -> bool:
+    """Returns whether a proto stores the object with the given name and project."""
+    return proto.spec.name == name and proto.spec.project == project
+
+
+def _proto_at(container: Any, idx: int) -> Optional[Any]:
+    """Returns the proto at a position of a repeated field, or None if there is none."""
+    try:
+        return container[idx]
+    except IndexError:
+        return None
+
+
+def _refresh_cache_periodically(
+    registry_ref: Callable[[], Optional["Registry"]],
+    interval_seconds: float,
+    stop_event: Event,
+):
+    """
+    Refreshes the cache of a registry every interval until the registry is
+    collected or the stop event is set.
+    """
+    while not stop_event.wait(interval_seconds):
+        registry = registry_ref()
+        if registry is None:
+            return
+        try:
+            registry.refresh()
+        except Exception:
+            logger.warning("Failed to refresh the registry cache", exc_info=True)
+        del registry
+
+
+@lru_cache(maxsize=None)
 def get_registry_store_class_from_type(registry_store_type: str):
     if not registry_store_type.endswith("RegistryStore"):
         raise Exception('Registry store class name should end with "RegistryStore"')
@@ -100,9 +279,11 @@ class Registry:
     # The cached_registry_proto object is used for both reads and writes. In particular,
     # all write operations refresh the cache and modify it in memory; the write must
     # then be persisted to the underlying RegistryStore with a call to commit().
+    # The cache expiry is tracked with the monotonic clock, in nanoseconds, so that
+    # checking it does not allocate and is not affected by changes of the system time.
     cached_registry_proto: Optional[RegistryProto] = None
-    cached_registry_proto_created: Optional[datetime] = None
-    cached_registry_proto_ttl: timedelta
+    cached_registry_proto_created_ns: Optional[int] = None
+    cached_registry_proto_ttl_ns: int
 
     def __init__(
         self, registry_config: Optional[RegistryConfig], repo_path: Optional[Path]
@@ -117,6 +298,13 @@ class Registry:
         """
 
         self._refresh_lock = Lock()
+        self._index: Optional[_RegistryIndex] = None
+        # Version of the registry in the store that the cached proto was read from,
+        # or None if it is unknown or the cached proto has been modified since
+        self._cached_registry_proto_version: Optional[str] = None
+        # Background thread refreshing the cache, if proactive refreshes are enabled
+        self._refresh_thread: Optional[Thread] = None
+        self._stop_refresh = Event()
 
         if registry_config:
             registry_store_type = registry_config.registry_store_type
@@ -127,21 +315,34 @@ class Registry:
                 cls = get_registry_store_class_from_type(str(registry_store_type))
 
             self._registry_store = cls(registry_config, repo_path)
-            self.cached_registry_proto_ttl = timedelta(
-                seconds=registry_config.cache_ttl_seconds
+            self.cached_registry_proto_ttl_ns = (
+                registry_config.cache_ttl_seconds * 1_000_000_000
                 if registry_config.cache_ttl_seconds is not None
                 else 0
             )
 
+            if registry_config.proactive_refresh and self.cached_registry_proto_ttl_ns:
+                # The thread only holds a weak reference to the registry, so that it
+                # does not keep the registry alive and stops once it is collected
+                self._refresh_thread = Thread(
+                    target=_refresh_cache_periodically,
+                    args=(
+                        weakref.ref(self),
+                        registry_config.cache_ttl_seconds
+                        * PROACTIVE_REFRESH_TTL_FRACTION,
+                        self._stop_refresh,
+                    ),
+                    daemon=True,
+                )
+                self._refresh_thread.start()
+
     def clone(self) -> "Registry":
         new_registry = Registry(None, None)
-        new_registry.cached_registry_proto_ttl = timedelta(seconds=0)
-        new_registry.cached_registry_proto = (
-            self.cached_registry_proto.__deepcopy__()
-            if self.cached_registry_proto
-            else RegistryProto()
-        )
-        new_registry.cached_registry_proto_created = datetime.utcnow()
+        new_registry.cached_registry_proto_ttl_ns = 0
+        new_registry.cached_registry_proto = RegistryProto()
+        if self.cached_registry_proto:
+            new_registry.cached_registry_proto.CopyFrom(self.cached_registry_proto)
+        new_registry.cached_registry_proto_created_ns = time.monotonic_ns()
         new_registry._registry_store = NoopRegistryStore()
         return new_registry
 
@@ -152,37 +353,21 @@ class Registry:
     ) -> RegistryDiff:
         diff = RegistryDiff()
 
-        attribute_to_object_type_str = {
-            "entities": "entity",
-            "feature_views": "feature view",
-            "feature_tables": "feature table",
-            "on_demand_feature_views": "on demand feature view",
-            "request_feature_views": "request feature view",
-            "feature_services": "feature service",
-        }
-
-        for object_type in [
-            "entities",
-            "feature_views",
-            "feature_tables",
-            "on_demand_feature_views",
-            "request_feature_views",
-            "feature_services",
-        ]:
+        for object_type, object_type_str in REGISTRY_OBJECT_TYPE_TO_STR.items():
+            current_objects = getattr(current_registry, object_type)
             (
                 objects_to_keep,
                 objects_to_delete,
                 objects_to_add,
             ) = tag_proto_objects_for_keep_delete_add(
-                getattr(current_registry, object_type),
-                getattr(new_registry, object_type),
+                current_objects, getattr(new_registry, object_type),
             )
 
             for e in objects_to_add:
                 diff.add_fco_diff(
                     FcoDiff(
                         e.spec.name,
-                        attribute_to_object_type_str[object_type],
+                        object_type_str,
                         None,
                         e,
                         [],
@@ -193,22 +378,23 @@ class Registry:
                 diff.add_fco_diff(
                     FcoDiff(
                         e.spec.name,
-                        attribute_to_object_type_str[object_type],
+                        object_type_str,
                         e,
                         None,
                         [],
                         TransitionType.DELETE,
                     )
                 )
+
+            current_objects_by_name: Dict[str, Any] = {}
+            for current_object in current_objects:
+                current_objects_by_name.setdefault(
+                    current_object.spec.name, current_object
+                )
             for e in objects_to_keep:
-                current_obj_proto = [
-                    _e
-                    for _e in getattr(current_registry, object_type)
-                    if _e.spec.name == e.spec.name
-                ][0]
                 diff.add_fco_diff(
                     diff_between(
-                        current_obj_proto, e, attribute_to_object_type_str[object_type]
+                        current_objects_by_name[e.spec.name], e, object_type_str
                     )
                 )
 
@@ -232,10 +418,9 @@ class Registry:
             project: Feast project that the Infra object refers to
             commit: Whether the change should be persisted immediately
         """
-        self._prepare_registry_for_changes()
-        assert self.cached_registry_proto
+        registry = self._prepare_registry_for_changes()
 
-        self.cached_registry_proto.infra.CopyFrom(infra.to_proto())
+        registry.infra.CopyFrom(infra.to_proto())
         if commit:
             self.commit()
 
@@ -265,20 +450,15 @@ class Registry:
         entity.is_valid()
         entity_proto = entity.to_proto()
         entity_proto.spec.project = project
-        self._prepare_registry_for_changes()
-        assert self.cached_registry_proto
-
-        for idx, existing_entity_proto in enumerate(
-            self.cached_registry_proto.entities
-        ):
-            if (
-                existing_entity_proto.spec.name == entity_proto.spec.name
-                and existing_entity_proto.spec.project == project
-            ):
-                del self.cached_registry_proto.entities[idx]
-                break
+        registry = self._prepare_registry_for_changes()
 
-        self.cached_registry_proto.entities.append(entity_proto)
+        idx = self._find_proto_index(
+            registry, "entities", entity_proto.spec.name, project
+        )
+        if idx is not None:
+            self._replace_proto(registry, "entities", idx, entity_proto)
+        else:
+            self._append_proto(registry, "entities", entity_proto)
         if commit:
             self.commit()
 
@@ -294,11 +474,10 @@ class Registry:
             List of entities
         """
         registry_proto = self._get_registry_proto(allow_cache=allow_cache)
-        entities = []
-        for entity_proto in registry_proto.entities:
-            if entity_proto.spec.project == project:
-                entities.append(Entity.from_proto(entity_proto))
-        return entities
+        return [
+            Entity.from_proto(proto)
+            for proto in self._project_protos(registry_proto, "entities", project)
+        ]
 
     def apply_feature_service(
         self, feature_service: FeatureService, project: str, commit: bool = True
@@ -315,14 +494,15 @@ class Registry:
 
         registry = self._prepare_registry_for_changes()
 
-        for idx, existing_feature_service_proto in enumerate(registry.feature_services):
-            if (
-                existing_feature_service_proto.spec.name
-                == feature_service_proto.spec.name
-                and existing_feature_service_proto.spec.project == project
-            ):
-                del registry.feature_services[idx]
-        registry.feature_services.append(feature_service_proto)
+        idx = self._find_proto_index(
+            registry, "feature_services", feature_service_proto.spec.name, project
+        )
+        if idx is not None:
+            self._replace_proto(
+                registry, "feature_services", idx, feature_service_proto
+            )
+        else:
+            self._append_proto(registry, "feature_services", feature_service_proto)
         if commit:
             self.commit()
 
@@ -341,13 +521,10 @@ class Registry:
         """
 
         registry = self._get_registry_proto(allow_cache=allow_cache)
-        feature_services = []
-        for feature_service_proto in registry.feature_services:
-            if feature_service_proto.spec.project == project:
-                feature_services.append(
-                    FeatureService.from_proto(feature_service_proto)
-                )
-        return feature_services
+        return [
+            FeatureService.from_proto(proto)
+            for proto in self._project_protos(registry, "feature_services", project)
+        ]
 
     def get_feature_service(
         self, name: str, project: str, allow_cache: bool = False
@@ -366,13 +543,10 @@ class Registry:
         """
         registry = self._get_registry_proto(allow_cache=allow_cache)
 
-        for feature_service_proto in registry.feature_services:
-            if (
-                feature_service_proto.spec.project == project
-                and feature_service_proto.spec.name == name
-            ):
-                return FeatureService.from_proto(feature_service_proto)
-        raise FeatureServiceNotFoundException(name, project=project)
+        found = self._find_proto(registry, "feature_services", name, project)
+        if found is None:
+            raise FeatureServiceNotFoundException(name, project=project)
+        return FeatureService.from_proto(found[1])
 
     def get_entity(self, name: str, project: str, allow_cache: bool = False) -> Entity:
         """
@@ -388,10 +562,10 @@ class Registry:
             none is found
         """
         registry_proto = self._get_registry_proto(allow_cache=allow_cache)
-        for entity_proto in registry_proto.entities:
-            if entity_proto.spec.name == name and entity_proto.spec.project == project:
-                return Entity.from_proto(entity_proto)
-        raise EntityNotFoundException(name, project=project)
+        found = self._find_proto(registry_proto, "entities", name, project)
+        if found is None:
+            raise EntityNotFoundException(name, project=project)
+        return Entity.from_proto(found[1])
 
     def apply_feature_view(
         self, feature_view: BaseFeatureView, project: str, commit: bool = True
@@ -409,43 +583,42 @@ class Registry:
             feature_view.created_timestamp = datetime.now()
         feature_view_proto = feature_view.to_proto()
         feature_view_proto.spec.project = project
-        self._prepare_registry_for_changes()
-        assert self.cached_registry_proto
-
-        self._check_conflicting_feature_view_names(feature_view)
-        existing_feature_views_of_same_type: RepeatedCompositeFieldContainer
-        if isinstance(feature_view, FeatureView):
-            existing_feature_views_of_same_type = (
-                self.cached_registry_proto.feature_views
-            )
-        elif isinstance(feature_view, OnDemandFeatureView):
-            existing_feature_views_of_same_type = (
-                self.cached_registry_proto.on_demand_feature_views
-            )
-        elif isinstance(feature_view, RequestFeatureView):
-            existing_feature_views_of_same_type = (
-                self.cached_registry_proto.request_feature_views
+        registry = self._prepare_registry_for_changes()
+
+        self._check_conflicting_feature_view_names(registry, feature_view)
+        field = FEATURE_VIEW_CLASS_TO_FIELD.get(type(feature_view))
+        if field is None:
+            # Subclasses are stored with the feature views they derive from
+            field = next(
+                (
+                    cls_field
+                    for cls, cls_field in FEATURE_VIEW_CLASS_TO_FIELD.items()
+                    if isinstance(feature_view, cls)
+                ),
+                None,
             )
-        else:
-            raise ValueError(f"Unexpected feature view type: {type(feature_view)}")
+            if field is None:
+                raise ValueError(f"Unexpected feature view type: {type(feature_view)}")
+        existing_feature_views_of_same_type: RepeatedCompositeFieldContainer = getattr(
+            registry, field
+        )
 
-        for idx, existing_feature_view_proto in enumerate(
-            existing_feature_views_of_same_type
-        ):
+        idx = self._find_proto_index(
+            registry, field, feature_view_proto.spec.name, project
+        )
+        if idx is not None:
+            existing_feature_view_proto = existing_feature_views_of_same_type[idx]
+            # Identical specs are compared natively, which spares deserializing the
+            # existing feature view when it is reapplied unchanged
             if (
-                existing_feature_view_proto.spec.name == feature_view_proto.spec.name
-                and existing_feature_view_proto.spec.project == project
+                existing_feature_view_proto.spec == feature_view_proto.spec
+                or feature_view.__class__.from_proto(existing_feature_view_proto)
+                == feature_view
             ):
-                if (
-                    feature_view.__class__.from_proto(existing_feature_view_proto)
-                    == feature_view
-                ):
-                    return
-                else:
-                    del existing_feature_views_of_same_type[idx]
-                    break
-
-        existing_feature_views_of_same_type.append(feature_view_proto)
+                return
+            self._replace_proto(registry, field, idx, feature_view_proto)
+        else:
+            self._append_proto(registry, field, feature_view_proto)
         if commit:
             self.commit()
 
@@ -464,13 +637,12 @@ class Registry:
         """
 
         registry = self._get_registry_proto(allow_cache=allow_cache)
-        on_demand_feature_views = []
-        for on_demand_feature_view in registry.on_demand_feature_views:
-            if on_demand_feature_view.spec.project == project:
-                on_demand_feature_views.append(
-                    OnDemandFeatureView.from_proto(on_demand_feature_view)
-                )
-        return on_demand_feature_views
+        return [
+            OnDemandFeatureView.from_proto(proto)
+            for proto in self._project_protos(
+                registry, "on_demand_feature_views", project
+            )
+        ]
 
     def get_on_demand_feature_view(
         self, name: str, project: str, allow_cache: bool = False
@@ -488,13 +660,10 @@ class Registry:
         """
         registry = self._get_registry_proto(allow_cache=allow_cache)
 
-        for on_demand_feature_view in registry.on_demand_feature_views:
-            if (
-                on_demand_feature_view.spec.project == project
-                and on_demand_feature_view.spec.name == name
-            ):
-                return OnDemandFeatureView.from_proto(on_demand_feature_view)
-        raise OnDemandFeatureViewNotFoundException(name, project=project)
+        found = self._find_proto(registry, "on_demand_feature_views", name, project)
+        if found is None:
+            raise OnDemandFeatureViewNotFoundException(name, project=project)
+        return OnDemandFeatureView.from_proto(found[1])
 
     def apply_materialization(
         self,
@@ -514,31 +683,24 @@ class Registry:
             end_date (datetime): End date of the materialization interval to track
             commit: Whether the change should be persisted immediately
         """
-        self._prepare_registry_for_changes()
-        assert self.cached_registry_proto
-
-        for idx, existing_feature_view_proto in enumerate(
-            self.cached_registry_proto.feature_views
-        ):
-            if (
-                existing_feature_view_proto.spec.name == feature_view.name
-                and existing_feature_view_proto.spec.project == project
-            ):
-                existing_feature_view = FeatureView.from_proto(
-                    existing_feature_view_proto
-                )
-                existing_feature_view.materialization_intervals.append(
-                    (start_date, end_date)
-                )
-                feature_view_proto = existing_feature_view.to_proto()
-                feature_view_proto.spec.project = project
-                del self.cached_registry_proto.feature_views[idx]
-                self.cached_registry_proto.feature_views.append(feature_view_proto)
-                if commit:
-                    self.commit()
-                return
+        registry = self._prepare_registry_for_changes()
 
-        raise FeatureViewNotFoundException(feature_view.name, project)
+        idx = self._find_proto_index(
+            registry, "feature_views", feature_view.name, project
+        )
+        if idx is None:
+            raise FeatureViewNotFoundException(feature_view.name, project)
+
+        # The interval is added to a copy of the stored proto, which callers may
+        # still hold references to
+        feature_view_proto = FeatureViewProto()
+        feature_view_proto.CopyFrom(registry.feature_views[idx])
+        interval_proto = feature_view_proto.meta.materialization_intervals.add()
+        interval_proto.start_time.FromDatetime(start_date)
+        interval_proto.end_time.FromDatetime(end_date)
+        self._replace_proto(registry, "feature_views", idx, feature_view_proto)
+        if commit:
+            self.commit()
 
     def list_feature_views(
         self, project: str, allow_cache: bool = False
@@ -554,11 +716,10 @@ class Registry:
             List of feature views
         """
         registry_proto = self._get_registry_proto(allow_cache=allow_cache)
-        feature_views: List[FeatureView] = []
-        for feature_view_proto in registry_proto.feature_views:
-            if feature_view_proto.spec.project == project:
-                feature_views.append(FeatureView.from_proto(feature_view_proto))
-        return feature_views
+        return [
+            FeatureView.from_proto(proto)
+            for proto in self._project_protos(registry_proto, "feature_views", project)
+        ]
 
     def list_request_feature_views(
         self, project: str, allow_cache: bool = False
@@ -574,13 +735,12 @@ class Registry:
             List of feature views
         """
         registry_proto = self._get_registry_proto(allow_cache=allow_cache)
-        feature_views: List[RequestFeatureView] = []
-        for request_feature_view_proto in registry_proto.request_feature_views:
-            if request_feature_view_proto.spec.project == project:
-                feature_views.append(
-                    RequestFeatureView.from_proto(request_feature_view_proto)
-                )
-        return feature_views
+        return [
+            RequestFeatureView.from_proto(proto)
+            for proto in self._project_protos(
+                registry_proto, "request_feature_views", project
+            )
+        ]
 
     def get_feature_view(
         self, name: str, project: str, allow_cache: bool = False
@@ -598,13 +758,10 @@ class Registry:
             none is found
         """
         registry_proto = self._get_registry_proto(allow_cache=allow_cache)
-        for feature_view_proto in registry_proto.feature_views:
-            if (
-                feature_view_proto.spec.name == name
-                and feature_view_proto.spec.project == project
-            ):
-                return FeatureView.from_proto(feature_view_proto)
-        raise FeatureViewNotFoundException(name, project)
+        found = self._find_proto(registry_proto, "feature_views", name, project)
+        if found is None:
+            raise FeatureViewNotFoundException(name, project)
+        return FeatureView.from_proto(found[1])
 
     def delete_feature_service(self, name: str, project: str, commit: bool = True):
         """
@@ -615,21 +772,15 @@ class Registry:
             project: Feast project that this feature service belongs to
             commit: Whether the change should be persisted immediately
         """
-        self._prepare_registry_for_changes()
-        assert self.cached_registry_proto
+        registry = self._prepare_registry_for_changes()
 
-        for idx, feature_service_proto in enumerate(
-            self.cached_registry_proto.feature_services
-        ):
-            if (
-                feature_service_proto.spec.name == name
-                and feature_service_proto.spec.project == project
-            ):
-                del self.cached_registry_proto.feature_services[idx]
-                if commit:
-                    self.commit()
-                return
-        raise FeatureServiceNotFoundException(name, project)
+        idx = self._find_proto_index(registry, "feature_services", name, project)
+        if idx is None:
+            raise FeatureServiceNotFoundException(name, project)
+
+        self._delete_proto(registry, "feature_services", idx)
+        if commit:
+            self.commit()
 
     def delete_feature_view(self, name: str, project: str, commit: bool = True):
         """
@@ -640,29 +791,12 @@ class Registry:
             project: Feast project that this feature view belongs to
             commit: Whether the change should be persisted immediately
         """
-        self._prepare_registry_for_changes()
-        assert self.cached_registry_proto
-
-        for idx, existing_feature_view_proto in enumerate(
-            self.cached_registry_proto.feature_views
-        ):
-            if (
-                existing_feature_view_proto.spec.name == name
-                and existing_feature_view_proto.spec.project == project
-            ):
-                del self.cached_registry_proto.feature_views[idx]
-                if commit:
-                    self.commit()
-                return
+        registry = self._prepare_registry_for_changes()
 
-        for idx, existing_request_feature_view_proto in enumerate(
-            self.cached_registry_proto.request_feature_views
-        ):
-            if (
-                existing_request_feature_view_proto.spec.name == name
-                and existing_request_feature_view_proto.spec.project == project
-            ):
-                del self.cached_registry_proto.request_feature_views[idx]
+        for field in ("feature_views", "request_feature_views"):
+            idx = self._find_proto_index(registry, field, name, project)
+            if idx is not None:
+                self._delete_proto(registry, field, idx)
                 if commit:
                     self.commit()
                 return
@@ -678,22 +812,15 @@ class Registry:
             project: Feast project that this entity belongs to
             commit: Whether the change should be persisted immediately
         """
-        self._prepare_registry_for_changes()
-        assert self.cached_registry_proto
+        registry = self._prepare_registry_for_changes()
 
-        for idx, existing_entity_proto in enumerate(
-            self.cached_registry_proto.entities
-        ):
-            if (
-                existing_entity_proto.spec.name == name
-                and existing_entity_proto.spec.project == project
-            ):
-                del self.cached_registry_proto.entities[idx]
-                if commit:
-                    self.commit()
-                return
+        idx = self._find_proto_index(registry, "entities", name, project)
+        if idx is None:
+            raise EntityNotFoundException(name, project)
 
-        raise EntityNotFoundException(name, project)
+        self._delete_proto(registry, "entities", idx)
+        if commit:
+            self.commit()
 
     def commit(self):
         """Commits the state of the registry cache to the remote registry store."""
@@ -704,8 +831,16 @@ class Registry:
         """Refreshes the state of the registry cache by fetching the registry state from the remote registry store."""
         self._get_registry_proto(allow_cache=False)
 
+    def close(self):
+        """Stops refreshing the registry cache in the background, if it was enabled."""
+        self._stop_refresh.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+            self._refresh_thread = None
+
     def teardown(self):
         """Tears down (removes) the registry."""
+        self.close()
         self._registry_store.teardown()
 
     def to_dict(self, project: str) -> Dict[str, List[Any]]:
@@ -718,49 +853,51 @@ class Registry:
             project: Feast project to convert to a dict
         """
         registry_dict = defaultdict(list)
+        registry_proto = self._get_registry_proto()
 
-        for entity in sorted(
-            self.list_entities(project=project), key=lambda entity: entity.name
-        ):
-            registry_dict["entities"].append(MessageToDict(entity.to_proto()))
-        for feature_view in sorted(
-            self.list_feature_views(project=project),
-            key=lambda feature_view: feature_view.name,
-        ):
-            registry_dict["featureViews"].append(MessageToDict(feature_view.to_proto()))
-        for feature_service in sorted(
-            self.list_feature_services(project=project),
-            key=lambda feature_service: feature_service.name,
-        ):
-            registry_dict["featureServices"].append(
-                MessageToDict(feature_service.to_proto())
-            )
-        for on_demand_feature_view in sorted(
-            self.list_on_demand_feature_views(project=project),
-            key=lambda on_demand_feature_view: on_demand_feature_view.name,
-        ):
-            registry_dict["onDemandFeatureViews"].append(
-                MessageToDict(on_demand_feature_view.to_proto())
-            )
-        for request_feature_view in sorted(
-            self.list_request_feature_views(project=project),
-            key=lambda request_feature_view: request_feature_view.name,
+        for key, field, proto_to_dict in (
+            ("entities", "entities", entity_proto_to_dict),
+            ("featureViews", "feature_views", feature_view_proto_to_dict),
+            ("featureServices", "feature_services", feature_service_proto_to_dict),
+            (
+                "onDemandFeatureViews",
+                "on_demand_feature_views",
+                on_demand_feature_view_proto_to_dict,
+            ),
+            (
+                "requestFeatureViews",
+                "request_feature_views",
+                request_feature_view_proto_to_dict,
+            ),
         ):
-            registry_dict["requestFeatureViews"].append(
-                MessageToDict(request_feature_view.to_proto())
+            container = getattr(registry_proto, field)
+            positions = self._get_registry_index(registry_proto).positions(
+                field, project
             )
+            for name in sorted(positions):
+                proto_dict = proto_to_dict(container[positions[name]])
+                # The project is only set on the registered protos, not on the
+                # protos of the objects themselves
+                proto_dict["spec"].pop("project", None)
+                registry_dict[key].append(proto_dict)
         return registry_dict
 
-    def _prepare_registry_for_changes(self):
-        """Prepares the Registry for changes by refreshing the cache if necessary."""
+    def _prepare_registry_for_changes(self) -> RegistryProto:
+        """
+        Prepares the Registry for changes by refreshing the cache if necessary, and
+        returns the cached RegistryProto that the changes should be applied to.
+        """
         try:
-            self._get_registry_proto(allow_cache=True)
+            registry_proto = self._get_registry_proto(allow_cache=True)
         except FileNotFoundError:
             registry_proto = RegistryProto()
             registry_proto.registry_schema_version = REGISTRY_SCHEMA_VERSION
             self.cached_registry_proto = registry_proto
-            self.cached_registry_proto_created = datetime.now()
-        return self.cached_registry_proto
+            self.cached_registry_proto_created_ns = time.monotonic_ns()
+        # The cached proto is about to be changed, so it no longer matches the
+        # version of the registry it was read from
+        self._cached_registry_proto_version = None
+        return registry_proto
 
     def _get_registry_proto(self, allow_cache: bool = False) -> RegistryProto:
         """Returns the cached or remote registry state
@@ -770,48 +907,139 @@ class Registry:
 
         Returns: Returns a RegistryProto object which represents the state of the registry
         """
-        with self._refresh_lock:
-            expired = (
-                self.cached_registry_proto is None
-                or self.cached_registry_proto_created is None
-            ) or (
-                self.cached_registry_proto_ttl.total_seconds()
-                > 0  # 0 ttl means infinity
-                and (
-                    datetime.now()
-                    > (
-                        self.cached_registry_proto_created
-                        + self.cached_registry_proto_ttl
-                    )
-                )
-            )
+        if allow_cache:
+            # Reading a cached registry that has not expired does not need the
+            # lock, which is only taken to refresh the cache
+            registry_proto = self._get_unexpired_cached_registry_proto()
+            if registry_proto is not None:
+                return registry_proto
 
-            if allow_cache and not expired:
-                assert isinstance(self.cached_registry_proto, RegistryProto)
+        with self._refresh_lock:
+            if allow_cache:
+                # Another thread may have refreshed the cache in the meantime
+                registry_proto = self._get_unexpired_cached_registry_proto()
+                if registry_proto is not None:
+                    return registry_proto
+
+            # The version is read before the proto, so that a write that happens
+            # in between is detected at the next refresh
+            version = self._registry_store.get_registry_proto_version()
+            if (
+                version is not None
+                and version == self._cached_registry_proto_version
+                and self.cached_registry_proto is not None
+            ):
+                # The registry has not changed in the store, so the cached proto
+                # does not need to be downloaded and parsed again
+                self.cached_registry_proto_created_ns = time.monotonic_ns()
                 return self.cached_registry_proto
 
             registry_proto = self._registry_store.get_registry_proto()
             self.cached_registry_proto = registry_proto
-            self.cached_registry_proto_created = datetime.now()
+            self.cached_registry_proto_created_ns = time.monotonic_ns()
+            self._cached_registry_proto_version = version
 
             return registry_proto
 
-    def _check_conflicting_feature_view_names(self, feature_view: BaseFeatureView):
-        name_to_fv_protos = self._existing_feature_view_names_to_fvs()
-        if feature_view.name in name_to_fv_protos:
-            if not isinstance(
-                name_to_fv_protos.get(feature_view.name), feature_view.proto_class
-            ):
-                raise ConflictingFeatureViewNames(feature_view.name)
-
-    def _existing_feature_view_names_to_fvs(self) -> Dict[str, Message]:
-        assert self.cached_registry_proto
-        odfvs = {
-            fv.spec.name: fv
-            for fv in self.cached_registry_proto.on_demand_feature_views
-        }
-        fvs = {fv.spec.name: fv for fv in self.cached_registry_proto.feature_views}
-        request_fvs = {
-            fv.spec.name: fv for fv in self.cached_registry_proto.request_feature_views
-        }
-        return {**odfvs, **fvs, **request_fvs}
+    def _get_unexpired_cached_registry_proto(self) -> Optional[RegistryProto]:
+        """Returns the cached RegistryProto, or None if there is none or it has expired."""
+        # The cache is refreshed by assigning the proto before its timestamp, so
+        # the timestamp is read first: a reader racing a refresh may pair the new
+        # proto with the old timestamp, but never an old proto with a new one.
+        created_ns = self.cached_registry_proto_created_ns
+        registry_proto = self.cached_registry_proto
+        if registry_proto is None or created_ns is None:
+            return None
+        ttl_ns = self.cached_registry_proto_ttl_ns
+        # 0 ttl means infinity
+        if ttl_ns > 0 and time.monotonic_ns() - created_ns > ttl_ns:
+            return None
+        return registry_proto
+
+    def _get_registry_index(self, registry_proto: RegistryProto) -> _RegistryIndex:
+        """Returns the index of the given RegistryProto, creating it if necessary."""
+        index = self._index
+        if index is None or index.registry_proto is not registry_proto:
+            index = _RegistryIndex(registry_proto)
+            self._index = index
+        return index
+
+    def _find_proto(
+        self, registry_proto: RegistryProto, field: str, name: str, project: str
+    ) -> Optional[Tuple[int, Any]]:
+        """
+        Returns the position and proto of the object with the given name and
+        project in a repeated field of the RegistryProto, or None if there is no
+        such object.
+        """
+        index = self._get_registry_index(registry_proto)
+        idx = index.positions(field, project).get(name)
+        if idx is None:
+            return None
+        container = getattr(registry_proto, field)
+        proto = _proto_at(container, idx)
+        if proto is not None and _is_object(proto, name, project):
+            return idx, proto
+        # Readers do not take a lock, so the object may have been moved by a
+        # concurrent change since its position was read
+        for idx, proto in enumerate(container):
+            if _is_object(proto, name, project):
+                return idx, proto
+        return None
+
+    def _find_proto_index(
+        self, registry_proto: RegistryProto, field: str, name: str, project: str
+    ) -> Optional[int]:
+        """
+        Returns the position of the object with the given name and project in a
+        repeated field of the RegistryProto, or None if there is no such object.
+        """
+        found = self._find_proto(registry_proto, field, name, project)
+        return None if found is None else found[0]
+
+    def _project_protos(
+        self, registry_proto: RegistryProto, field: str, project: str
+    ) -> List[Any]:
+        """
+        Returns the protos of the objects of a project in a repeated field of the
+        RegistryProto, in the order in which they are stored.
+        """
+        index = self._get_registry_index(registry_proto)
+        container = getattr(registry_proto, field)
+        protos = []
+        for name, idx in sorted(
+            index.positions(field, project).items(), key=itemgetter(1)
+        ):
+            proto = _proto_at(container, idx)
+            if proto is None or not _is_object(proto, name, project):
+                # An object was moved by a concurrent change since the positions
+                # were read, so the objects of the project are scanned for
+                return [proto for proto in container if proto.spec.project == project]
+            protos.append(proto)
+        return protos
+
+    def _append_proto(self, registry_proto: RegistryProto, field: str, proto: Any):
+        """Appends an object to a repeated field of the RegistryProto."""
+        self._get_registry_index(registry_proto).append(field, proto)
+
+    def _replace_proto(
+        self, registry_proto: RegistryProto, field: str, idx: int, proto: Any
+    ):
+        """Replaces the object at a position of a repeated field of the RegistryProto."""
+        self._get_registry_index(registry_proto).replace(field, idx, proto)
+
+    def _delete_proto(self, registry_proto: RegistryProto, field: str, idx: int):
+        """Deletes the object at a position of a repeated field of the RegistryProto."""
+        self._get_registry_index(registry_proto).delete(field, idx)
+
+    def _check_conflicting_feature_view_names(
+        self, registry_proto: RegistryProto, feature_view: BaseFeatureView
+    ):
+        index = self._get_registry_index(registry_proto)
+        for field, proto_class in FEATURE_VIEW_FIELDS_BY_PRECEDENCE:
+            if index.has_name(field, feature_view.name):
+                # The type of the stored proto is known from its field, so it
+                # does not need to be read
+                if proto_class is not feature_view.proto_class:
+                    raise ConflictingFeatureViewNames(feature_view.name)
+                return
@@ -0,0 +1,261 @@
+"""
+Dictionary representations of the objects stored in the registry.
+
+These functions produce the same output as `MessageToDict` for the corresponding
+protos, but access the fields directly instead of going through the descriptors
+of every message, which makes `Registry.to_dict` considerably cheaper. Keys are
+emitted in field number order, as `MessageToDict` does.
+"""
+import base64
+from typing import Any, Dict
+
+from google.protobuf.json_format import MessageToDict
+
+from feast.protos.feast.core.DataSource_pb2 import DataSource as DataSourceProto
+from feast.protos.feast.core.Entity_pb2 import Entity as EntityProto
+from feast.protos.feast.core.Feature_pb2 import FeatureSpecV2 as FeatureSpecProto
+from feast.protos.feast.core.FeatureService_pb2 import (
+    FeatureService as FeatureServiceProto,
+)
+from feast.protos.feast.core.FeatureView_pb2 import FeatureView as FeatureViewProto
+from feast.protos.feast.core.FeatureViewProjection_pb2 import (
+    FeatureViewProjection as FeatureViewProjectionProto,
+)
+from feast.protos.feast.core.OnDemandFeatureView_pb2 import (
+    OnDemandFeatureView as OnDemandFeatureViewProto,
+)
+from feast.protos.feast.core.RequestFeatureView_pb2 import (
+    RequestFeatureView as RequestFeatureViewProto,
+)
+from feast.protos.feast.types.Value_pb2 import ValueType as ValueTypeProto
+
+JsonObject = Dict[str, Any]
+
+
+def _set_value_type(result: JsonObject, value_type: int):
+    if value_type:
+        try:
+            result["valueType"] = ValueTypeProto.Enum.Name(value_type)
+        except ValueError:
+            result["valueType"] = value_type
+
+
+def _set_timestamp(result: JsonObject, key: str, message: Any, field: str):
+    if message.HasField(field):
+        result[key] = getattr(message, field).ToJsonString()
+
+
+def _data_source_proto_to_dict(data_source_proto: DataSourceProto) -> JsonObject:
+    # Data sources are made of many oneofs and options messages, and there are
+    # only a couple of them per feature view, so they are not worth special casing
+    return MessageToDict(data_source_proto)
+
+
+def _feature_spec_proto_to_dict(feature_spec_proto: FeatureSpecProto) -> JsonObject:
+    result: JsonObject = {}
+    if feature_spec_proto.name:
+        result["name"] = feature_spec_proto.name
+    _set_value_type(result, feature_spec_proto.value_type)
+    if feature_spec_proto.labels:
+        result["labels"] = dict(feature_spec_proto.labels)
+    return result
+
+
+def _feature_view_projection_proto_to_dict(
+    projection_proto: FeatureViewProjectionProto,
+) -> JsonObject:
+    result: JsonObject = {}
+    if projection_proto.feature_view_name:
+        result["featureViewName"] = projection_proto.feature_view_name
+    if projection_proto.feature_columns:
+        result["featureColumns"] = [
+            _feature_spec_proto_to_dict(feature_column)
+            for feature_column in projection_proto.feature_columns
+        ]
+    if projection_proto.feature_view_name_alias:
+        result["featureViewNameAlias"] = projection_proto.feature_view_name_alias
+    if projection_proto.join_key_map:
+        result["joinKeyMap"] = dict(projection_proto.join_key_map)
+    return result
+
+
+def entity_proto_to_dict(entity_proto: EntityProto) -> JsonObject:
+    """Returns the same dictionary as `MessageToDict(entity_proto)`."""
+    result: JsonObject = {}
+    if entity_proto.HasField("spec"):
+        spec_proto = entity_proto.spec
+        spec: JsonObject = {}
+        if spec_proto.name:
+            spec["name"] = spec_proto.name
+        _set_value_type(spec, spec_proto.value_type)
+        if spec_proto.description:
+            spec["description"] = spec_proto.description
+        if spec_proto.join_key:
+            spec["joinKey"] = spec_proto.join_key
+        if spec_proto.labels:
+            spec["labels"] = dict(spec_proto.labels)
+        if spec_proto.project:
+            spec["project"] = spec_proto.project
+        result["spec"] = spec
+    if entity_proto.HasField("meta"):
+        meta: JsonObject = {}
+        _set_timestamp(meta, "createdTimestamp", entity_proto.meta, "created_timestamp")
+        _set_timestamp(
+            meta, "lastUpdatedTimestamp", entity_proto.meta, "last_updated_timestamp"
+        )
+        result["meta"] = meta
+    return result
+
+
+def feature_view_proto_to_dict(feature_view_proto: FeatureViewProto) -> JsonObject:
+    """Returns the same dictionary as `MessageToDict(feature_view_proto)`."""
+    result: JsonObject = {}
+    if feature_view_proto.HasField("spec"):
+        spec_proto = feature_view_proto.spec
+        spec: JsonObject = {}
+        if spec_proto.name:
+            spec["name"] = spec_proto.name
+        if spec_proto.project:
+            spec["project"] = spec_proto.project
+        if spec_proto.entities:
+            spec["entities"] = list(spec_proto.entities)
+        if spec_proto.features:
+            spec["features"] = [
+                _feature_spec_proto_to_dict(feature) for feature in spec_proto.features
+            ]
+        if spec_proto.tags:
+            spec["tags"] = dict(spec_proto.tags)
+        if spec_proto.HasField("ttl"):
+            spec["ttl"] = spec_proto.ttl.ToJsonString()
+        if spec_proto.HasField("batch_source"):
+            spec["batchSource"] = _data_source_proto_to_dict(spec_proto.batch_source)
+        if spec_proto.online:
+            spec["online"] = spec_proto.online
+        if spec_proto.HasField("stream_source"):
+            spec["streamSource"] = _data_source_proto_to_dict(spec_proto.stream_source)
+        result["spec"] = spec
+    if feature_view_proto.HasField("meta"):
+        meta_proto = feature_view_proto.meta
+        meta: JsonObject = {}
+        _set_timestamp(meta, "createdTimestamp", meta_proto, "created_timestamp")
+        _set_timestamp(
+            meta, "lastUpdatedTimestamp", meta_proto, "last_updated_timestamp"
+        )
+        if meta_proto.materialization_intervals:
+            intervals = []
+            for interval_proto in meta_proto.materialization_intervals:
+                interval: JsonObject = {}
+                _set_timestamp(interval, "startTime", interval_proto, "start_time")
+                _set_timestamp(interval, "endTime", interval_proto, "end_time")
+                intervals.append(interval)
+            meta["materializationIntervals"] = intervals
+        result["meta"] = meta
+    return result
+
+
+def feature_service_proto_to_dict(
+    feature_service_proto: FeatureServiceProto,
+) -> JsonObject:
+    """Returns the same dictionary as `MessageToDict(feature_service_proto)`."""
+    result: JsonObject = {}
+    if feature_service_proto.HasField("spec"):
+        spec_proto = feature_service_proto.spec
+        spec: JsonObject = {}
+        if spec_proto.name:
+            spec["name"] = spec_proto.name
+        if spec_proto.project:
+            spec["project"] = spec_proto.project
+        if spec_proto.features:
+            spec["features"] = [
+                _feature_view_projection_proto_to_dict(projection)
+                for projection in spec_proto.features
+            ]
+        if spec_proto.tags:
+            spec["tags"] = dict(spec_proto.tags)
+        if spec_proto.description:
+            spec["description"] = spec_proto.description
+        result["spec"] = spec
+    if feature_service_proto.HasField("meta"):
+        meta: JsonObject = {}
+        _set_timestamp(
+            meta, "createdTimestamp", feature_service_proto.meta, "created_timestamp"
+        )
+        _set_timestamp(
+            meta,
+            "lastUpdatedTimestamp",
+            feature_service_proto.meta,
+            "last_updated_timestamp",
+        )
+        result["meta"] = meta
+    return result
+
+
+def on_demand_feature_view_proto_to_dict(
+    on_demand_feature_view_proto: OnDemandFeatureViewProto,
+) -> JsonObject:
+    """Returns the same dictionary as `MessageToDict(on_demand_feature_view_proto)`."""
+    result: JsonObject = {}
+    if on_demand_feature_view_proto.HasField("spec"):
+        spec_proto = on_demand_feature_view_proto.spec
+        spec: JsonObject = {}
+        if spec_proto.name:
+            spec["name"] = spec_proto.name
+        if spec_proto.project:
+            spec["project"] = spec_proto.project
+        if spec_proto.features:
+            spec["features"] = [
+                _feature_spec_proto_to_dict(feature) for feature in spec_proto.features
+            ]
+        if spec_proto.inputs:
+            inputs: JsonObject = {}
+            for input_name, input_proto in spec_proto.inputs.items():
+                input_dict: JsonObject = {}
+                if input_proto.HasField("feature_view"):
+                    input_dict["featureView"] = feature_view_proto_to_dict(
+                        input_proto.feature_view
+                    )
+                elif input_proto.HasField("request_data_source"):
+                    input_dict["requestDataSource"] = _data_source_proto_to_dict(
+                        input_proto.request_data_source
+                    )
+                inputs[input_name] = input_dict
+            spec["inputs"] = inputs
+        if spec_proto.HasField("user_defined_function"):
+            udf_proto = spec_proto.user_defined_function
+            udf: JsonObject = {}
+            if udf_proto.name:
+                udf["name"] = udf_proto.name
+            if udf_proto.body:
+                udf["body"] = base64.b64encode(udf_proto.body).decode("utf-8")
+            spec["userDefinedFunction"] = udf
+        result["spec"] = spec
+    if on_demand_feature_view_proto.HasField("meta"):
+        meta: JsonObject = {}
+        _set_timestamp(
+            meta,
+            "createdTimestamp",
+            on_demand_feature_view_proto.meta,
+            "created_timestamp",
+        )
+        result["meta"] = meta
+    return result
+
+
+def request_feature_view_proto_to_dict(
+    request_feature_view_proto: RequestFeatureViewProto,
+) -> JsonObject:
+    """Returns the same dictionary as `MessageToDict(request_feature_view_proto)`."""
+    result: JsonObject = {}
+    if request_feature_view_proto.HasField("spec"):
+        spec_proto = request_feature_view_proto.spec
+        spec: JsonObject = {}
+        if spec_proto.name:
+            spec["name"] = spec_proto.name
+        if spec_proto.project:
+            spec["project"] = spec_proto.project
+        if spec_proto.HasField("request_data_source"):
+            spec["requestDataSource"] = _data_source_proto_to_dict(
+                spec_proto.request_data_source
+            )
+        result["spec"] = spec
+    return result
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 
@@ -19,6 +20,17 @@ class RegistryStore(ABC):
         """
         pass
 
+    def get_registry_proto_version(self) -> Optional[str]:
+        """
+        Retrieves a token that changes whenever the registry stored at the registry path
+        is overwritten, without reading the registry itself.
+
+        Returns:
+            Returns the version of the stored registry, or None if it cannot be determined,
+            in which case the registry proto is always read again when it is refreshed.
+        """
+        return None
+
     @abstractmethod
     def update_registry_proto(self, registry_proto: RegistryProto):
         """
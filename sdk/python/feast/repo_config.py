@@ -5,6 +5,7 @@ from typing import Any
 import yaml
 from pydantic import (
     BaseModel,
+    StrictBool,
     StrictInt,
     StrictStr,
     ValidationError,
@@ -81,6 +82,12 @@ class RegistryConfig(FeastBaseModel):
      set to infinity by setting TTL to 0 seconds, which means the cache will only be loaded once and will never
      expire. Users can manually refresh the cache by calling feature_store.refresh_registry() """
 
+    proactive_refresh: StrictBool = False
+    """bool: Whether the registry cache should be refreshed by a background thread before its TTL is exceeded, so
+     that feature store methods never wait for the registry to be read. This is meant for long running processes that
+     only read the registry, such as feature servers: uncommitted changes to the registry state are discarded whenever
+     the cache is refreshed. It has no effect when the TTL is set to infinity. """
+
 
 class RepoConfig(FeastBaseModel):
     """ Repo config. Typically loaded from `feature_store.yaml` """
@@ -14,7 +14,7 @@
 
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Sized, Tuple, Type
+from typing import Any, Callable, Dict, List, Optional, Set, Sized, Tuple, Type
 
 import numpy as np
 import pandas as pd
@@ -238,6 +238,43 @@ PYTHON_SCALAR_VALUE_TYPE_TO_PROTO_VALUE: Dict[
 }
 
 
+# Scalar converters resolved by _scalar_proto_value_converter, keyed by the
+# target ValueType and the Python type of the values being converted.
+_SCALAR_PROTO_VALUE_CONVERTERS: Dict[
+    Tuple[ValueType, Type], Callable[[Any], ProtoValue]
+] = {}
+
+
+def _scalar_proto_value_converter(
+    feast_value_type: ValueType, sample: Any
+) -> Callable[[Any], ProtoValue]:
+    """
+    Returns a function converting a single Python scalar of the same type as
+    sample into a Feast Value Proto of the given value type.
+
+    The sample is only validated the first time a (value type, Python type)
+    pair is seen; the resulting converter is then reused for later calls.
+    """
+    key = (feast_value_type, type(sample))
+    if key not in _SCALAR_PROTO_VALUE_CONVERTERS:
+        (
+            field_name,
+            func,
+            valid_scalar_types,
+        ) = PYTHON_SCALAR_VALUE_TYPE_TO_PROTO_VALUE[feast_value_type]
+        if valid_scalar_types:
+            assert type(sample) in valid_scalar_types
+
+        def convert(value: Any) -> ProtoValue:
+            proto_value = ProtoValue()
+            setattr(proto_value, field_name, func(value))
+            return proto_value
+
+        _SCALAR_PROTO_VALUE_CONVERTERS[key] = convert
+
+    return _SCALAR_PROTO_VALUE_CONVERTERS[key]
+
+
 def _python_value_to_proto_value(
     feast_value_type: ValueType, values: List[Any]
 ) -> List[ProtoValue]:
@@ -293,18 +330,9 @@ def _python_value_to_proto_value(
             return [ProtoValue(int64_val=int(value)) for value in values]
 
         if feast_value_type in PYTHON_SCALAR_VALUE_TYPE_TO_PROTO_VALUE:
-            (
-                field_name,
-                func,
-                valid_scalar_types,
-            ) = PYTHON_SCALAR_VALUE_TYPE_TO_PROTO_VALUE[feast_value_type]
-            if valid_scalar_types:
-                assert type(sample) in valid_scalar_types
-
+            convert = _scalar_proto_value_converter(feast_value_type, sample)
             return [
-                ProtoValue(**{field_name: func(value)})
-                if not pd.isnull(value)
-                else ProtoValue()
+                convert(value) if not pd.isnull(value) else ProtoValue()
                 for value in values
             ]
 
@@ -332,6 +360,25 @@ def python_values_to_proto_values(
     return _python_value_to_proto_value(value_type, values)
 
 
+PROTO_VALUE_FIELD_TO_VALUE_TYPE: Dict[Optional[str], ValueType] = {
+    "int32_val": ValueType.INT32,
+    "int64_val": ValueType.INT64,
+    "double_val": ValueType.DOUBLE,
+    "float_val": ValueType.FLOAT,
+    "string_val": ValueType.STRING,
+    "bytes_val": ValueType.BYTES,
+    "bool_val": ValueType.BOOL,
+    "int32_list_val": ValueType.INT32_LIST,
+    "int64_list_val": ValueType.INT64_LIST,
+    "double_list_val": ValueType.DOUBLE_LIST,
+    "float_list_val": ValueType.FLOAT_LIST,
+    "string_list_val": ValueType.STRING_LIST,
+    "bytes_list_val": ValueType.BYTES_LIST,
+    "bool_list_val": ValueType.BOOL_LIST,
+    None: ValueType.NULL,
+}
+
+
 def _proto_value_to_value_type(proto_value: ProtoValue) -> ValueType:
     """
     Returns Feast ValueType given Feast ValueType string.
@@ -343,25 +390,7 @@ def _proto_value_to_value_type(proto_value: ProtoValue) -> ValueType:
         A variant of ValueType.
     """
     proto_str = proto_value.WhichOneof("val")
-    type_map = {
-        "int32_val": ValueType.INT32,
-        "int64_val": ValueType.INT64,
-        "double_val": ValueType.DOUBLE,
-        "float_val": ValueType.FLOAT,
-        "string_val": ValueType.STRING,
-        "bytes_val": ValueType.BYTES,
-        "bool_val": ValueType.BOOL,
-        "int32_list_val": ValueType.INT32_LIST,
-        "int64_list_val": ValueType.INT64_LIST,
-        "double_list_val": ValueType.DOUBLE_LIST,
-        "float_list_val": ValueType.FLOAT_LIST,
-        "string_list_val": ValueType.STRING_LIST,
-        "bytes_list_val": ValueType.BYTES_LIST,
-        "bool_list_val": ValueType.BOOL_LIST,
-        None: ValueType.NULL,
-    }
-
-    return type_map[proto_str]
+    return PROTO_VALUE_FIELD_TO_VALUE_TYPE[proto_str]
 
 
 def pa_to_feast_value_type(pa_type_as_str: str) -> ValueType:
@@ -11,8 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import threading
 import time
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from tempfile import mkstemp
 
 import pandas as pd
@@ -22,9 +24,11 @@ from pytest_lazyfixture import lazy_fixture
 from feast import FileSource
 from feast.data_format import ParquetFormat
 from feast.entity import Entity
+from feast.errors import ConflictingFeatureViewNames, EntityNotFoundException
 from feast.feature import Feature
 from feast.feature_view import FeatureView
 from feast.on_demand_feature_view import RequestDataSource, on_demand_feature_view
+from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 from feast.protos.feast.types import Value_pb2 as ValueProto
 from feast.registry import Registry
 from feast.repo_config import RegistryConfig
@@ -114,6 +118,134 @@ def test_apply_entity_success(test_registry):
         test_registry._get_registry_proto()
 
 
+@pytest.mark.parametrize(
+    "test_registry", [lazy_fixture("local_registry")],
+)
+def test_get_and_delete_entities_across_projects(test_registry):
+    for project in ["project_a", "project_b"]:
+        for name in ["driver", "customer", "rider"]:
+            test_registry.apply_entity(
+                Entity(name=name, value_type=ValueType.INT64, description=project),
+                project,
+            )
+
+    test_registry.delete_entity("driver", "project_a")
+
+    with pytest.raises(EntityNotFoundException):
+        test_registry.get_entity("driver", "project_a")
+    for name in ["customer", "rider"]:
+        assert test_registry.get_entity(name, "project_a").description == "project_a"
+    for name in ["driver", "customer", "rider"]:
+        assert test_registry.get_entity(name, "project_b").description == "project_b"
+
+    test_registry.teardown()
+
+
+@pytest.mark.parametrize(
+    "test_registry", [lazy_fixture("local_registry")],
+)
+def test_held_entity_protos_are_not_modified(test_registry):
+    project = "project"
+    for name in ["a", "b", "c"]:
+        test_registry.apply_entity(
+            Entity(name=name, value_type=ValueType.INT64, description=f"{name}1"),
+            project,
+        )
+
+    ref_a, ref_b, _ = test_registry.cached_registry_proto.entities
+    test_registry.apply_entity(
+        Entity(name="a", value_type=ValueType.INT64, description="a2"), project,
+    )
+    test_registry.delete_entity("b", project)
+
+    assert (ref_a.spec.name, ref_a.spec.description) == ("a", "a1")
+    assert (ref_b.spec.name, ref_b.spec.description) == ("b", "b1")
+    assert test_registry.get_entity("a", project).description == "a2"
+    assert test_registry.get_entity("c", project).description == "c1"
+    with pytest.raises(EntityNotFoundException):
+        test_registry.get_entity("b", project)
+
+    test_registry.teardown()
+
+
+@pytest.mark.parametrize(
+    "test_registry", [lazy_fixture("local_registry")],
+)
+def test_apply_materialization(test_registry):
+    project = "project"
+    fv = FeatureView(
+        name="my_feature_view",
+        features=[Feature(name="fs1_my_feature_1", dtype=ValueType.INT64)],
+        entities=["driver"],
+        batch_source=FileSource(path="file://feast/*", event_timestamp_column="ts"),
+        ttl=timedelta(minutes=5),
+    )
+    test_registry.apply_feature_view(fv, project)
+
+    ref = test_registry.cached_registry_proto.feature_views[0]
+    start_date = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    end_date = datetime(2021, 1, 2, tzinfo=timezone.utc)
+    test_registry.apply_materialization(fv, project, start_date, end_date)
+
+    assert len(ref.meta.materialization_intervals) == 0
+    feature_view = test_registry.get_feature_view("my_feature_view", project)
+    assert feature_view.materialization_intervals == [(start_date, end_date)]
+
+    test_registry.teardown()
+
+
+@pytest.mark.parametrize(
+    "test_registry", [lazy_fixture("local_registry")],
+)
+def test_cached_objects_are_not_shared(test_registry):
+    project = "project"
+    test_registry.apply_entity(
+        Entity(name="driver", value_type=ValueType.INT64, description="Driver"),
+        project,
+    )
+
+    fv = FeatureView(
+        name="my_feature_view",
+        features=[Feature(name="fs1_my_feature_1", dtype=ValueType.INT64)],
+        entities=["driver"],
+        tags={"team": "matchmaking"},
+        batch_source=FileSource(path="file://feast/*", event_timestamp_column="ts"),
+        ttl=timedelta(minutes=5),
+    )
+    test_registry.apply_feature_view(fv, project)
+
+    entity = test_registry.get_entity("driver", project, allow_cache=True)
+    entity.description = "Changed"
+    feature_view = test_registry.get_feature_view(
+        "my_feature_view", project, allow_cache=True
+    )
+    feature_view.tags["team"] = "changed"
+    feature_view.features.append(Feature(name="extra", dtype=ValueType.INT64))
+    feature_view.entities.append("extra")
+    feature_view.batch_source.event_timestamp_column = "changed"
+
+    assert (
+        test_registry.get_entity("driver", project, allow_cache=True).description
+        == "Driver"
+    )
+    assert (
+        test_registry.list_entities(project, allow_cache=True)[0].description
+        == "Driver"
+    )
+    for feature_view in [
+        test_registry.get_feature_view("my_feature_view", project, allow_cache=True),
+        test_registry.list_feature_views(project, allow_cache=True)[0],
+    ]:
+        assert feature_view.tags == {"team": "matchmaking"}
+        assert [feature.name for feature in feature_view.features] == [
+            "fs1_my_feature_1"
+        ]
+        assert feature_view.entities == ["driver"]
+        assert feature_view.batch_source.event_timestamp_column == "ts"
+
+    test_registry.teardown()
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize(
     "test_registry", [lazy_fixture("gcs_registry"), lazy_fixture("s3_registry")],
@@ -353,6 +485,45 @@ def test_modify_feature_views_success(test_registry):
         test_registry._get_registry_proto()
 
 
+@pytest.mark.parametrize(
+    "test_registry", [lazy_fixture("local_registry")],
+)
+def test_apply_conflicting_feature_view_names(test_registry):
+    request_source = RequestDataSource(
+        name="request_source", schema={"my_input_1": ValueType.INT32}
+    )
+
+    @on_demand_feature_view(
+        features=[Feature(name="my_feature_1", dtype=ValueType.INT32)],
+        inputs={"request_source": request_source},
+    )
+    def my_feature_view(feature_df: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({"my_feature_1": feature_df["my_input_1"]})
+
+    fv = FeatureView(
+        name="my_feature_view",
+        features=[Feature(name="my_feature_1", dtype=ValueType.INT64)],
+        entities=["my_entity_1"],
+        batch_source=FileSource(path="file://feast/*", event_timestamp_column="ts"),
+        ttl=timedelta(minutes=5),
+    )
+
+    test_registry.apply_feature_view(fv, "project")
+    with pytest.raises(ConflictingFeatureViewNames):
+        test_registry.apply_feature_view(my_feature_view, "other_project")
+
+    test_registry.delete_feature_view("my_feature_view", "project")
+    test_registry.apply_feature_view(my_feature_view, "other_project")
+    assert (
+        test_registry.get_on_demand_feature_view(
+            "my_feature_view", "other_project"
+        ).name
+        == "my_feature_view"
+    )
+
+    test_registry.teardown()
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize(
     "test_registry", [lazy_fixture("gcs_registry"), lazy_fixture("s3_registry")],
@@ -507,3 +678,133 @@ def test_commit():
     # Will try to reload registry, which will fail because the file has been deleted
     with pytest.raises(FileNotFoundError):
         test_registry._get_registry_proto()
+
+
+def test_cached_registry_expires():
+    fd, registry_path = mkstemp()
+    registry_config = RegistryConfig(path=registry_path, cache_ttl_seconds=600)
+    test_registry = Registry(registry_config, None)
+    project = "project"
+    test_registry.apply_entity(
+        Entity(name="driver", value_type=ValueType.INT64, description="Driver"),
+        project,
+    )
+
+    cached_registry_proto = test_registry._get_registry_proto(allow_cache=True)
+    assert test_registry._get_registry_proto(allow_cache=True) is cached_registry_proto
+
+    # Move the creation of the cache past its ttl
+    test_registry.cached_registry_proto_created_ns -= 601 * 1_000_000_000
+    assert (
+        test_registry._get_registry_proto(allow_cache=True) is not cached_registry_proto
+    )
+
+    test_registry.teardown()
+
+
+def test_refresh_reuses_unchanged_registry():
+    fd, registry_path = mkstemp()
+    registry_config = RegistryConfig(path=registry_path, cache_ttl_seconds=600)
+    test_registry = Registry(registry_config, None)
+    project = "project"
+    test_registry.apply_entity(
+        Entity(name="driver", value_type=ValueType.INT64, description="Driver"),
+        project,
+    )
+
+    def age_registry_file():
+        modified_ns = time.time_ns() - 60 * 1_000_000_000
+        os.utime(registry_path, ns=(modified_ns, modified_ns))
+
+    age_registry_file()
+    test_registry.refresh()
+    registry_proto = test_registry.cached_registry_proto
+    test_registry.refresh()
+    assert test_registry.cached_registry_proto is registry_proto
+
+    other_registry = Registry(registry_config, None)
+    other_registry.delete_entity("driver", project)
+    age_registry_file()
+    test_registry.refresh()
+    assert test_registry.cached_registry_proto is not registry_proto
+    assert test_registry.list_entities(project) == []
+
+    test_registry.teardown()
+
+
+def test_proactive_refresh():
+    fd, registry_path = mkstemp()
+    registry_config = RegistryConfig(
+        path=registry_path, cache_ttl_seconds=1, proactive_refresh=True
+    )
+    test_registry = Registry(registry_config, None)
+    project = "project"
+    test_registry.apply_entity(
+        Entity(name="driver", value_type=ValueType.INT64, description="Driver"),
+        project,
+    )
+    registry_proto = test_registry.cached_registry_proto
+    refresh_thread = test_registry._refresh_thread
+
+    try:
+        # The cache is refreshed in the background before it expires
+        deadline = time.monotonic() + 10
+        while (
+            test_registry.cached_registry_proto is registry_proto
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.1)
+        assert test_registry.cached_registry_proto is not registry_proto
+        assert (
+            test_registry._get_unexpired_cached_registry_proto()
+            is test_registry.cached_registry_proto
+        )
+    finally:
+        test_registry.teardown()
+
+    # Tearing down the registry stops the background refreshes
+    assert not refresh_thread.is_alive()
+
+
+def test_concurrent_reads_of_refreshed_registry():
+    fd, registry_path = mkstemp()
+    registry_config = RegistryConfig(path=registry_path, cache_ttl_seconds=600)
+    test_registry = Registry(registry_config, None)
+    project = "project"
+    num_entities = 20000
+    registry_proto = RegistryProto()
+    for i in range(num_entities):
+        entity_proto = Entity(
+            name=f"entity_{i}", value_type=ValueType.INT64, description=""
+        ).to_proto()
+        entity_proto.spec.project = project
+        registry_proto.entities.append(entity_proto)
+    test_registry._registry_store.update_registry_proto(registry_proto)
+
+    # Every thread looks entities up while the index of the freshly read
+    # registry is still being built by the others
+    num_threads = 8
+    test_registry.refresh()
+    barrier = threading.Barrier(num_threads)
+    errors = []
+
+    def get_entities(thread_idx):
+        barrier.wait()
+        for i in range(thread_idx, num_entities, num_entities // 30):
+            try:
+                test_registry.get_entity(f"entity_{i}", project, allow_cache=True)
+            except EntityNotFoundException as e:
+                errors.append(e)
+
+    threads = [
+        threading.Thread(target=get_entities, args=(thread_idx,))
+        for thread_idx in range(num_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+    test_registry.teardown()
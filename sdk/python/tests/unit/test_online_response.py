@@ -0,0 +1,84 @@
+import numpy as np
+import pyarrow
+
+from feast.online_response import OnlineResponse
+from feast.protos.feast.serving.ServingService_pb2 import (
+    FieldStatus,
+    GetOnlineFeaturesResponse,
+)
+from feast.protos.feast.types.Value_pb2 import Value
+
+
+def _online_response_proto(num_rows: int) -> GetOnlineFeaturesResponse:
+    response = GetOnlineFeaturesResponse()
+    for i in range(num_rows):
+        field_values = response.field_values.add()
+        field_values.fields["driver_id"].int64_val = i
+        field_values.statuses["driver_id"] = FieldStatus.PRESENT
+        field_values.fields["rating"].CopyFrom(
+            Value(double_val=i * 1.5) if i % 2 else Value()
+        )
+        field_values.statuses["rating"] = FieldStatus.PRESENT
+        field_values.fields["trips"].int64_list_val.val.extend(range(i))
+        field_values.statuses["trips"] = FieldStatus.PRESENT
+        field_values.statuses["missing"] = FieldStatus.NOT_FOUND
+    return response
+
+
+def test_online_response_to_dict():
+    result = OnlineResponse(_online_response_proto(3)).to_dict()
+
+    assert result == {
+        "driver_id": [0, 1, 2],
+        "rating": [0.0, 1.5, 0.0],
+        "trips": [[], [0], [0, 1]],
+        "missing": [None, None, None],
+    }
+
+
+def test_online_response_single_row_to_dict():
+    result = OnlineResponse(_online_response_proto(1)).to_dict()
+
+    assert result == {
+        "driver_id": [0],
+        "rating": [None],
+        "trips": [[]],
+        "missing": [None],
+    }
+    assert type(result["trips"][0]) is list
+
+
+def test_online_response_to_df():
+    df = OnlineResponse(_online_response_proto(3)).to_df()
+
+    assert df["driver_id"].dtype == np.int64
+    assert df["rating"].dtype == np.float64
+    assert df["driver_id"].tolist() == [0, 1, 2]
+    assert df["rating"].tolist() == [0.0, 1.5, 0.0]
+    assert df["trips"].tolist() == [[], [0], [0, 1]]
+    assert all(type(trips) is list for trips in df["trips"])
+    assert df["missing"].tolist() == [None, None, None]
+
+
+def test_online_response_columns_are_cached_per_proto():
+    online_response = OnlineResponse(_online_response_proto(3))
+
+    online_response.to_dict()["driver_id"].append(3)
+    assert online_response.to_dict()["driver_id"] == [0, 1, 2]
+
+    online_response.to_dict()["trips"][1].append(1)
+    online_response.to_df()["trips"][2].append(2)
+    assert online_response.to_dict()["trips"] == [[], [0], [0, 1]]
+    assert online_response.to_df()["trips"].tolist() == [[], [0], [0, 1]]
+
+    online_response.proto = _online_response_proto(2)
+    assert online_response.to_dict()["driver_id"] == [0, 1]
+
+
+def test_online_response_to_arrow():
+    table = OnlineResponse(_online_response_proto(3)).to_arrow()
+
+    assert table.schema.field("driver_id").type == pyarrow.int64()
+    assert table.schema.field("trips").type == pyarrow.list_(pyarrow.int64())
+    assert table.column("rating").to_pylist() == [0.0, 1.5, 0.0]
+    assert table.column("missing").null_count == 3
@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+from google.protobuf.json_format import MessageToDict
+
+from feast import Entity, Feature, FeatureService, FileSource, ValueType
+from feast.data_source import RequestDataSource
+from feast.feature_view import FeatureView
+from feast.on_demand_feature_view import on_demand_feature_view
+from feast.protos.feast.core.Entity_pb2 import Entity as EntityProto
+from feast.protos.feast.core.FeatureService_pb2 import (
+    FeatureService as FeatureServiceProto,
+)
+from feast.protos.feast.core.FeatureView_pb2 import FeatureView as FeatureViewProto
+from feast.protos.feast.core.OnDemandFeatureView_pb2 import (
+    OnDemandFeatureView as OnDemandFeatureViewProto,
+)
+from feast.protos.feast.core.RequestFeatureView_pb2 import (
+    RequestFeatureView as RequestFeatureViewProto,
+)
+from feast.registry_dict_utils import (
+    entity_proto_to_dict,
+    feature_service_proto_to_dict,
+    feature_view_proto_to_dict,
+    on_demand_feature_view_proto_to_dict,
+    request_feature_view_proto_to_dict,
+)
+from feast.request_feature_view import RequestFeatureView
+
+
+def _feature_view() -> FeatureView:
+    feature_view = FeatureView(
+        name="driver_stats",
+        entities=["driver"],
+        ttl=timedelta(days=1, microseconds=5),
+        features=[
+            Feature(name="trips", dtype=ValueType.INT64, labels={"team": "a"}),
+            Feature(name="rating", dtype=ValueType.DOUBLE),
+        ],
+        batch_source=FileSource(
+            path="driver_stats.parquet", event_timestamp_column="ts"
+        ),
+        tags={"owner": "feast"},
+    )
+    feature_view.created_timestamp = datetime(2021, 10, 1, 12)
+    feature_view.materialization_intervals.append(
+        (datetime(2021, 10, 1), datetime(2021, 10, 2, 3, 4, 5, 6))
+    )
+    return feature_view
+
+
+def test_entity_proto_to_dict():
+    entity_proto = Entity(
+        name="driver",
+        value_type=ValueType.INT64,
+        description="Driver",
+        labels={"team": "a"},
+    ).to_proto()
+    entity_proto.spec.project = "project"
+    entity_proto.meta.created_timestamp.FromDatetime(datetime(2021, 10, 1, 12))
+
+    assert entity_proto_to_dict(entity_proto) == MessageToDict(entity_proto)
+
+
+def test_feature_view_proto_to_dict():
+    feature_view_proto = _feature_view().to_proto()
+    feature_view_proto.spec.project = "project"
+
+    feature_view_dict = feature_view_proto_to_dict(feature_view_proto)
+
+    assert feature_view_dict == MessageToDict(feature_view_proto)
+    assert list(feature_view_dict["spec"]) == list(
+        MessageToDict(feature_view_proto)["spec"]
+    )
+
+
+def test_feature_service_proto_to_dict():
+    feature_view = _feature_view()
+    feature_service_proto = FeatureService(
+        name="driver_service",
+        features=[
+            feature_view[["trips"]],
+            feature_view.with_name("stats").with_join_key_map({"driver": "rider"}),
+        ],
+        tags={"owner": "feast"},
+        description="Driver service",
+    ).to_proto()
+
+    assert feature_service_proto_to_dict(feature_service_proto) == MessageToDict(
+        feature_service_proto
+    )
+
+
+def test_on_demand_feature_view_proto_to_dict():
+    request_source = RequestDataSource(name="request", schema={"x": ValueType.INT64})
+
+    @on_demand_feature_view(
+        features=[Feature(name="trips_plus_x", dtype=ValueType.INT64)],
+        inputs={"driver_stats": _feature_view(), "request": request_source},
+    )
+    def trips_plus_x(inputs: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({"trips_plus_x": inputs["trips"] + inputs["x"]})
+
+    on_demand_feature_view_proto = trips_plus_x.to_proto()
+
+    assert on_demand_feature_view_proto_to_dict(
+        on_demand_feature_view_proto
+    ) == MessageToDict(on_demand_feature_view_proto)
+
+
+def test_request_feature_view_proto_to_dict():
+    request_feature_view_proto = RequestFeatureView(
+        name="request_view",
+        request_data_source=RequestDataSource(
+            name="request", schema={"x": ValueType.INT64}
+        ),
+    ).to_proto()
+
+    assert request_feature_view_proto_to_dict(
+        request_feature_view_proto
+    ) == MessageToDict(request_feature_view_proto)
+
+
+@pytest.mark.parametrize(
+    "proto_to_dict,proto",
+    [
+        (entity_proto_to_dict, EntityProto()),
+        (feature_view_proto_to_dict, FeatureViewProto()),
+        (feature_service_proto_to_dict, FeatureServiceProto()),
+        (on_demand_feature_view_proto_to_dict, OnDemandFeatureViewProto()),
+        (request_feature_view_proto_to_dict, RequestFeatureViewProto()),
+    ],
+)
+def test_empty_proto_to_dict(proto_to_dict, proto):
+    assert proto_to_dict(proto) == MessageToDict(proto) == {}